@@ -1,26 +1,35 @@
 import os.path
-from collections import OrderedDict
-from typing import Set
+from typing import Dict, FrozenSet, Set, Union
 
 from loguru import logger
 
 # Only used for type hints, package-relative import not possible due to circular reference
 import orchestra.model.configuration
-from .util import run_user_script, run_internal_script, get_script_output
-from .util import try_run_internal_script, try_get_script_output
+from .util import impl as util_impl
 
 
 class Action:
     def __init__(self, name, script, config):
         self.name = name
+        # The configuration does not change for the lifetime of the action, so everything derived from it (paths,
+        # remote URLs, scripts, the environment) is computed only once
         self.config: "orchestra.model.configuration.Configuration" = config
-        self._explicit_dependencies: Set[Action] = set()
+        self._explicit_dependencies: Union[Set[Action], FrozenSet[Action]] = set()
+        self._dependencies_for_hash_cache = None
+        self._environment_cache = None
+        # Names never change, so they are formatted only once
+        self._name_for_info = None
+        self._str = None
         self._script = script
 
     def run(self, pretend=False, explicitly_requested=False):
         logger.info(f"Executing {self}")
         if not pretend:
-            self._run(explicitly_requested=explicitly_requested)
+            try:
+                self._run(explicitly_requested=explicitly_requested)
+            finally:
+                # Running an action may change whether any action is satisfied
+                self.config.satisfied_cache.clear()
 
     def _run(self, explicitly_requested=False):
         """Executes the action"""
@@ -38,15 +47,30 @@ class Action:
         return self._script
 
     def add_explicit_dependency(self, dependency):
+        assert not isinstance(self._explicit_dependencies, frozenset), "Called add_explicit_dependency after finalize"
         self._explicit_dependencies.add(dependency)
+        self._dependencies_for_hash_cache = None
+
+    def finalize(self):
+        """Freezes the explicit dependencies. Called once the configuration has been fully loaded"""
+        self._explicit_dependencies = frozenset(self._explicit_dependencies)
+        self._dependencies_for_hash_cache = None
 
     @property
     def dependencies(self):
-        return self._explicit_dependencies.union(self._implicit_dependencies())
+        # Implicit dependencies are not cached: they can depend on the filesystem state and on attributes which can be
+        # changed after the configuration is loaded (e.g. InstallAction.allow_build)
+        return frozenset(self._explicit_dependencies).union(self._implicit_dependencies())
 
     @property
     def dependencies_for_hash(self):
-        return self._explicit_dependencies.union(self._implicit_dependencies_for_hash())
+        # Implicit dependencies for hash only depend on how the configuration is structured, so they are evaluated
+        # once, the first time they are requested. The cache is reset when an explicit dependency is added
+        if self._dependencies_for_hash_cache is None:
+            self._dependencies_for_hash_cache = frozenset(self._explicit_dependencies).union(
+                self._implicit_dependencies_for_hash()
+            )
+        return self._dependencies_for_hash_cache
 
     def _implicit_dependencies(self):
         return set()
@@ -55,12 +79,31 @@ class Action:
         return self._implicit_dependencies()
 
     def is_satisfied(self):
-        """Returns true if the action is satisfied."""
+        """Returns true if the action is satisfied.
+        The result is memoized in the configuration until an action is run or a component is uninstalled
+        """
+        satisfied = self.config.satisfied_cache.get(self)
+        if satisfied is None:
+            satisfied = self._is_satisfied()
+            self.config.satisfied_cache[self] = satisfied
+        return satisfied
+
+    def _is_satisfied(self):
         raise NotImplementedError()
 
     @property
-    def environment(self) -> "OrderedDict[str, str]":
+    def environment(self) -> "Dict[str, str]":
         """Returns additional environment variables provided to the script to be run"""
+        # A copy is returned as callers are allowed to modify it
+        return self._cached_environment().copy()
+
+    def _cached_environment(self) -> "Dict[str, str]":
+        """Returns the environment without copying it. Callers must not modify it"""
+        if self._environment_cache is None:
+            self._environment_cache = self._create_environment()
+        return self._environment_cache
+
+    def _create_environment(self) -> "Dict[str, str]":
         return self.config.global_env()
 
     @property
@@ -69,7 +112,9 @@ class Action:
 
     @property
     def name_for_info(self):
-        return f"{self.name} {self._target_name}"
+        if self._name_for_info is None:
+            self._name_for_info = f"{self.name} {self._target_name}"
+        return self._name_for_info
 
     @property
     def name_for_graph(self):
@@ -80,44 +125,58 @@ class Action:
         return self._target_name
 
     def __str__(self):
-        return f"Action {self.name} of {self._target_name}"
+        if self._str is None:
+            self._str = f"Action {self.name} of {self._target_name}"
+        return self._str
 
     def __repr__(self):
         return self.__str__()
 
-    def _run_user_script(self, script, cwd=None):
-        run_user_script(script, environment=self.environment, cwd=cwd)
+    # The helpers below accept an already computed environment, callers running several scripts
+    # can compute it once and pass it along
+
+    def _run_user_script(self, script, cwd=None, environment=None):
+        if environment is None:
+            environment = self.environment
+        util_impl._run_user_script(script, environment=environment, check_returncode=True, cwd=cwd)
 
-    def _run_internal_script(self, script, cwd=None):
-        run_internal_script(script, environment=self.environment, cwd=cwd)
+    def _run_internal_script(self, script, cwd=None, environment=None):
+        if environment is None:
+            environment = self.environment
+        util_impl._run_internal_script(script, environment=environment, check_returncode=True, cwd=cwd)
 
-    def _try_run_internal_script(self, script, cwd=None):
-        return try_run_internal_script(script, environment=self.environment, cwd=cwd)
+    def _try_run_internal_script(self, script, cwd=None, environment=None):
+        if environment is None:
+            environment = self.environment
+        return util_impl._run_internal_script(script, environment=environment, check_returncode=False, cwd=cwd)
 
-    def _get_script_output(self, script, cwd=None):
-        return get_script_output(script, environment=self.environment, cwd=cwd)
+    def _get_script_output(self, script, cwd=None, environment=None):
+        if environment is None:
+            environment = self.environment
+        _, output = util_impl._get_script_output(script, environment=environment, check_returncode=True, cwd=cwd)
+        return output
 
-    def _try_get_script_output(self, script, cwd=None):
-        return try_get_script_output(script, environment=self.environment, cwd=cwd)
+    def _try_get_script_output(self, script, cwd=None, environment=None):
+        if environment is None:
+            environment = self.environment
+        return util_impl._get_script_output(script, environment=environment, check_returncode=False, cwd=cwd)
 
 
 class ActionForRepository(Action):
     def __init__(self, name, repository, script, config):
         super().__init__(name, script, config)
         self.repository = repository
+        self._source_dir = os.path.join(config.sources_dir, repository) if repository else None
 
-    @property
-    def environment(self) -> "OrderedDict[str, str]":
-        env = super().environment
+    def _create_environment(self) -> "Dict[str, str]":
+        env = super()._create_environment()
         if self.source_dir:
             env["SOURCE_DIR"] = self.source_dir
         return env
 
     @property
     def source_dir(self) -> str:
-        if self.repository:
-            return os.path.join(self.config.sources_dir, self.repository)
-        return None
+        return self._source_dir
 
     @property
     def _target_name(self):
@@ -130,22 +189,25 @@ class ActionForBuild(ActionForRepository):
         super().__init__(name, build.component.repository, script, config)
         self.component = build.component
         self.build = build
+        self._qualified_name = None
+        self._build_dir = os.path.join(config.builds_dir, build.component.name, build.name)
 
-    @property
-    def environment(self) -> "OrderedDict[str, str]":
-        env = super().environment
+    def _create_environment(self) -> "Dict[str, str]":
+        env = super()._create_environment()
         env["BUILD_DIR"] = self.build_dir
-        env["TMP_ROOT"] = self.tmp_root
+        env["TMP_ROOT"] = os.path.join(env["TMP_ROOTS"], self.build.safe_name)
         return env
 
     @property
     def build_dir(self) -> str:
-        return os.path.join(self.config.builds_dir, self.build.component.name, self.build.name)
+        return self._build_dir
 
     @property
     def tmp_root(self) -> str:
-        return os.path.join(super().environment["TMP_ROOTS"], self.build.safe_name)
+        return self._cached_environment()["TMP_ROOT"]
 
     @property
     def _target_name(self):
-        return self.build.qualified_name
+        if self._qualified_name is None:
+            self._qualified_name = self.build.qualified_name
+        return self._qualified_name
@@ -7,37 +7,35 @@ from .. import gitutils
 class CloneAction(ActionForRepository):
     def __init__(self, repository, config):
         super().__init__("clone", repository, None, config)
+        # URLs of the repository on each remote, in priority order
+        self.remote_urls = tuple(f"{remote_base_url}/{repository}" for remote_base_url in config.remotes.values())
 
     @property
     def script(self):
-        script = 'mkdir -p "$(dirname "$SOURCE_DIR")"\n'
-
-        clone_cmds = []
-        for remote_base_url in self.config.remotes.values():
-            clone_cmds.append(f'git clone "{remote_base_url}/{self.repository}" "$SOURCE_DIR"')
-        script += " || \\\n  ".join(clone_cmds)
-        script += "\n"
-
-        script += 'git -C "$SOURCE_DIR" branch -m orchestra-temporary\n'
-
-        checkout_cmds = []
-        for branch in self.config.branches:
-            checkout_cmds.append(f'git -C "$SOURCE_DIR" checkout -b "{branch}" "origin/{branch}"')
-        checkout_cmds.append("true")
-        script += " || \\\n  ".join(checkout_cmds)
-        return script
-
-    def is_satisfied(self):
-        return os.path.exists(self.environment["SOURCE_DIR"])
+        if self._script is None:
+            clone_cmds = " || \\\n  ".join(f'git clone "{url}" "$SOURCE_DIR"' for url in self.remote_urls)
+            checkout_cmds = [
+                f'git -C "$SOURCE_DIR" checkout -b "{branch}" "origin/{branch}"' for branch in self.config.branches
+            ]
+            checkout_cmds = " || \\\n  ".join(checkout_cmds + ["true"])
+            self._script = (
+                'mkdir -p "$(dirname "$SOURCE_DIR")"\n'
+                f"{clone_cmds}\n"
+                'git -C "$SOURCE_DIR" branch -m orchestra-temporary\n'
+                f"{checkout_cmds}"
+            )
+        return self._script
+
+    def _is_satisfied(self):
+        return os.path.isdir(self.source_dir)
 
     def heads(self):
         """Returns a dictionary of branch names -> commit hash.
         This information is retrieved either from the local clone
         or from the first remote where the repository exists"""
         # Give priority to the local checkout
-        source_dir = self.environment["SOURCE_DIR"]
-        if os.path.exists(source_dir):
-            return gitutils.ls_remote(source_dir)
+        if os.path.exists(self.source_dir):
+            return gitutils.ls_remote(self.source_dir)
 
         return self.config.remote_heads_cache.heads(self.repository)
 
@@ -46,9 +44,8 @@ class CloneAction(ActionForRepository):
         If a local clone exists the information regards the currently checked out branch,
         otherwise it is taken from the configured remotes.
         """
-        source_dir = self.environment["SOURCE_DIR"]
-        if gitutils.is_root_of_git_repo(source_dir):
-            return gitutils.current_branch_info(source_dir)
+        if gitutils.is_root_of_git_repo(self.source_dir):
+            return gitutils.current_branch_info(self.source_dir)
 
         branches = self.heads()
         if branches:
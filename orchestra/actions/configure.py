@@ -11,7 +11,7 @@ class ConfigureAction(ActionForBuild):
     def __init__(self, build, script, config):
         super().__init__("configure", build, script, config)
 
-    def is_satisfied(self):
+    def _is_satisfied(self):
         # TODO: invalidate configure if recursive_hash has changed
         return os.path.exists(self._configure_successful_path)
 
@@ -19,7 +19,7 @@ class ConfigureAction(ActionForBuild):
         if self._configure_successful_path.exists():
             logger.warning("This component was already successfully configured, rerunning configure script")
             os.remove(self._configure_successful_path)
-        elif os.path.exists(self.environment["BUILD_DIR"]):
+        elif os.path.exists(self.build_dir):
             logger.warning("Previous configure probably failed, running configure script in a dirty environment")
             logger.warning(
                 f"You might want to delete the build directory (use `orchestra clean {self.build.qualified_name}`)"
@@ -34,7 +34,7 @@ class ConfigureAction(ActionForBuild):
 
     @property
     def _configure_successful_path(self) -> Path:
-        return Path(self.environment["BUILD_DIR"], ".configure_successful")
+        return Path(self.build_dir, ".configure_successful")
 
     def _implicit_dependencies(self):
         if self.build.component.clone:
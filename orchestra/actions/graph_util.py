@@ -1,9 +1,26 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import networkx as nx
 
 from .any_of import AnyOfAction
 from .action import Action
 
 
+def check_satisfied(actions):
+    """Returns a dictionary mapping each of the given actions to whether it is satisfied.
+
+    Checking if an action is satisfied usually requires filesystem access or running git,
+    so all the actions are evaluated concurrently.
+    """
+    actions = list(actions)
+    if not actions:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        return dict(zip(actions, executor.map(lambda action: action.is_satisfied(), actions)))
+
+
 def assign_style(graph):
     """Applies style attributes to the nodes of a dependency graph.
 
@@ -13,17 +30,19 @@ def assign_style(graph):
     - Satisfied actions: green
     - Unsatisfied actions: white
     """
-    styles = {}
+    satisfied = check_satisfied(node for node in graph.nodes if isinstance(node, Action))
+
+    # networkx copies the attributes into each node, so the same style can be shared by all nodes of a given color
+    styles = {
+        color: {"shape": "box", "style": "filled", "fillcolor": color} for color in ("lightblue", "green", "white")
+    }
+    node_styles = {}
     for node in graph.nodes:
         if isinstance(node, AnyOfAction):
             color = "lightblue"
-        elif isinstance(node, Action) and node.is_satisfied():
+        elif satisfied.get(node):
             color = "green"
         else:
             color = "white"
-        styles[node] = {
-            "shape": "box",
-            "style": "filled",
-            "fillcolor": color,
-        }
-    nx.set_node_attributes(graph, styles)
+        node_styles[node] = styles[color]
+    nx.set_node_attributes(graph, node_styles)
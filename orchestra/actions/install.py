@@ -4,16 +4,15 @@ import pathlib
 import shutil
 import stat
 import time
-from collections import OrderedDict, defaultdict
+from collections import defaultdict
 from pathlib import Path
 from textwrap import dedent
-from typing import Iterable, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from loguru import logger
 
 from .action import ActionForBuild
 from .uninstall import uninstall
-from .util import run_user_script
 from ..exceptions import (
     BinaryArchiveNotFoundException,
     InternalCommandException,
@@ -68,8 +67,9 @@ class InstallAction(ActionForBuild):
         self.discard_build_directories = discard_build_directories
 
     def _run(self, explicitly_requested=False):
-        tmp_root = self.environment["TMP_ROOT"]
-        orchestra_root = self.environment["ORCHESTRA_ROOT"]
+        env = self._cached_environment()
+        tmp_root = env["TMP_ROOT"]
+        orchestra_root = env["ORCHESTRA_ROOT"]
 
         logger.debug("Preparing temporary root directory")
         self._prepare_tmproot()
@@ -222,7 +222,7 @@ class InstallAction(ActionForBuild):
         env["RUN_TESTS"] = "1" if self.run_tests else "0"
 
         logger.debug("Executing install script")
-        run_user_script(self.script, environment=env)
+        self._run_user_script(self.script, environment=env)
 
         logger.debug("Removing conflicting files")
         self._remove_conflicting_files()
@@ -300,7 +300,8 @@ class InstallAction(ActionForBuild):
     def _collect_times(self):
         """Returns a dict[path, times], where times is a tuple(atime_ns, mtime_ns)"""
         times = {}
-        for root, dirnames, filenames in os.walk(f'{self.environment["TMP_ROOT"]}{self.environment["ORCHESTRA_ROOT"]}'):
+        env = self._cached_environment()
+        for root, dirnames, filenames in os.walk(f'{env["TMP_ROOT"]}{env["ORCHESTRA_ROOT"]}'):
             for path in filenames:
                 fullpath = os.path.join(root, path)
                 info = os.lstat(fullpath)
@@ -355,7 +356,8 @@ class InstallAction(ActionForBuild):
 
     def _hard_to_symbolic(self):
         duplicates = defaultdict(list)
-        for root, dirnames, filenames in os.walk(f'{self.environment["TMP_ROOT"]}{self.environment["ORCHESTRA_ROOT"]}'):
+        env = self._cached_environment()
+        for root, dirnames, filenames in os.walk(f'{env["TMP_ROOT"]}{env["ORCHESTRA_ROOT"]}'):
             for path in filenames:
                 path = os.path.join(root, path)
                 info = os.lstat(path)
@@ -626,17 +628,16 @@ class InstallAction(ActionForBuild):
         """Returns True if the binary archive for the target build exists (cached or downloadable)"""
         return self.locate_binary_archive() is not None
 
-    @property
-    def environment(self) -> "OrderedDict[str, str]":
-        env = super().environment
-        env["DESTDIR"] = self.tmp_root
+    def _create_environment(self) -> "Dict[str, str]":
+        env = super()._create_environment()
+        env["DESTDIR"] = env["TMP_ROOT"]
         return env
 
     @property
     def architecture(self):
         return "linux-x86-64"
 
-    def is_satisfied(self):
+    def _is_satisfied(self):
         return is_installed(
             self.config,
             self.build.component.name,
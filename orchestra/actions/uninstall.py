@@ -64,3 +64,5 @@ def uninstall(component_name, config):
 
     logger.debug(f"Deleting metadata file {metadata_path}")
     os.remove(metadata_path)
+
+    config.satisfied_cache.clear()
@@ -1,4 +1,3 @@
-from collections import OrderedDict
 from subprocess import CompletedProcess
 from typing import NoReturn
 
@@ -10,7 +9,7 @@ from .impl import _run_user_script
 from .impl import _run_script, _exec_script
 
 
-def run_internal_script(script, environment: OrderedDict = None, cwd=None):
+def run_internal_script(script, environment: dict = None, cwd=None):
     """Helper for running internal scripts.
     If the script returns a nonzero exit code an error is logged and an InternalScriptException is raised.
     :param script: the script to run
@@ -20,7 +19,7 @@ def run_internal_script(script, environment: OrderedDict = None, cwd=None):
     _run_internal_script(script, environment=environment, check_returncode=True, cwd=cwd)
 
 
-def try_run_internal_script(script, environment: OrderedDict = None, cwd=None):
+def try_run_internal_script(script, environment: dict = None, cwd=None):
     """Helper for running internal scripts that might fail.
     :param script: the script to run
     :param environment: optional additional environment variables
@@ -30,7 +29,7 @@ def try_run_internal_script(script, environment: OrderedDict = None, cwd=None):
     return _run_internal_script(script, environment=environment, check_returncode=False, cwd=cwd)
 
 
-def run_user_script(script, environment: OrderedDict = None, cwd=None):
+def run_user_script(script, environment: dict = None, cwd=None):
     """Helper for running user scripts.
     If the script returns a nonzero exit code an UserScriptException is raised.
     :param script: the script to run
@@ -42,7 +41,7 @@ def run_user_script(script, environment: OrderedDict = None, cwd=None):
 
 def run_script(
     script,
-    environment: OrderedDict = None,
+    environment: dict = None,
     strict_flags=True,
     cwd=None,
     loglevel="INFO",
@@ -64,7 +63,7 @@ def run_script(
 
 def exec_script(
     script,
-    environment: OrderedDict = None,
+    environment: dict = None,
     strict_flags=True,
     cwd=None,
     loglevel="INFO",
@@ -79,7 +78,7 @@ def exec_script(
     _exec_script(script, environment, strict_flags, cwd, loglevel)
 
 
-def get_script_output(script, environment: OrderedDict = None, decode_as="utf-8", cwd=None):
+def get_script_output(script, environment: dict = None, decode_as="utf-8", cwd=None):
     """Helper for getting stdout of a script.
     If the script returns a nonzero exit code an error is logged and an InternalScriptException is raised.
     :param script: the script to run
@@ -98,7 +97,7 @@ def get_script_output(script, environment: OrderedDict = None, decode_as="utf-8"
     return output
 
 
-def try_get_script_output(script, environment: OrderedDict = None, decode_as="utf-8", cwd=None):
+def try_get_script_output(script, environment: dict = None, decode_as="utf-8", cwd=None):
     """Helper for getting stdout of a script that might fail.
     :param script: the script to run
     :param environment: optional additional environment variables
@@ -120,7 +119,7 @@ def try_get_script_output(script, environment: OrderedDict = None, decode_as="ut
 
 def run_internal_subprocess(
     argv,
-    environment: [OrderedDict, dict] = None,
+    environment: dict = None,
     cwd=None,
 ):
     """Helper for running an internal subprocess.
@@ -134,7 +133,7 @@ def run_internal_subprocess(
 
 def try_run_internal_subprocess(
     argv,
-    environment: [OrderedDict, dict] = None,
+    environment: dict = None,
     cwd=None,
 ):
     """Helper for running an internal subprocess that might fail.
@@ -1,7 +1,6 @@
 import os
 import sys
 import subprocess
-from collections import OrderedDict
 from pathlib import Path
 from typing import NoReturn, Optional, Mapping, Union
 
@@ -93,7 +92,7 @@ def _exec_script(
         os.execvpe("/bin/bash", ["/bin/bash", "-c", script_to_run], os.environ)
 
 
-def _run_internal_script(script, environment: OrderedDict = None, check_returncode=True, cwd=None):
+def _run_internal_script(script, environment: dict = None, check_returncode=True, cwd=None):
     """Helper for running internal scripts.
     :param script: the script to run
     :param environment: optional additional environment variables
@@ -124,7 +123,7 @@ def _run_internal_script(script, environment: OrderedDict = None, check_returnco
     return result.returncode
 
 
-def _run_user_script(script, environment: OrderedDict = None, check_returncode=True, cwd=None):
+def _run_user_script(script, environment: dict = None, check_returncode=True, cwd=None):
     """Helper for running user scripts
     :param script: the script to run
     :param environment: optional additional environment variables
@@ -160,7 +159,7 @@ def _run_user_script(script, environment: OrderedDict = None, check_returncode=T
 
 def _get_script_output(
     script,
-    environment: OrderedDict = None,
+    environment: dict = None,
     check_returncode=True,
     decode_as="utf-8",
     cwd=None,
@@ -199,7 +198,7 @@ def _get_script_output(
 
 def _run_subprocess(
     argv,
-    environment: [OrderedDict, dict] = None,
+    environment: dict = None,
     cwd=None,
     loglevel="INFO",
     stdout=None,
@@ -225,7 +224,7 @@ def _run_subprocess(
 
 def _run_internal_subprocess(
     argv,
-    environment: [OrderedDict, dict] = None,
+    environment: dict = None,
     cwd=None,
     check_returncode=True,
 ):
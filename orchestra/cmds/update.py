@@ -1,4 +1,5 @@
 import os.path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from textwrap import dedent
 
 from loguru import logger
@@ -66,18 +67,36 @@ def handle_update(args):
 
     if to_pull:
         logger.info("Updating repositories")
-        progress_bar = tqdm(to_pull, unit="components")
-        for component in progress_bar:
+
+        def pull_repository(component):
+            """Pulls the sources of a component. Returns a description of the failure, or None on success"""
             source_path = os.path.join(config.sources_dir, component.name)
             logger.debug(f"Pulling {component.name}")
-            progress_bar.set_postfix_str(f"{component.name}")
 
             if not is_root_of_git_repo(source_path):
-                failed_pulls.append(f"Repository {component.name}: Directory {source_path} is not a git repo")
-                continue
+                return f"Repository {component.name}: Directory {source_path} is not a git repo"
 
             if not git_pull(source_path):
-                failed_pulls.append(f"Repository {component.name}")
+                return f"Repository {component.name}"
+
+            return None
+
+        # Pulls mostly wait on the network, so run them in parallel
+        pull_results = {}
+        with tqdm(total=len(to_pull), unit="components") as progress_bar:
+            with ThreadPoolExecutor(max_workers=args.parallelism) as executor:
+                futures = {executor.submit(pull_repository, component): component for component in to_pull}
+                # Advance the progress bar as pulls complete, whatever order they complete in
+                for future in as_completed(futures):
+                    component = futures[future]
+                    pull_results[component] = future.result()
+                    progress_bar.set_postfix_str(f"{component.name}")
+                    progress_bar.update()
+
+        # Report failures in a stable order
+        for component in to_pull:
+            if pull_results[component] is not None:
+                failed_pulls.append(pull_results[component])
 
     if failed_pulls:
         formatted_failed_pulls = "\n".join([f"  - {repo}" for repo in failed_pulls])
@@ -10,6 +10,7 @@ from loguru import logger
 
 from .actions import AnyOfAction
 from .actions.action import ActionForBuild
+from .actions.graph_util import check_satisfied
 from .util import set_terminal_title
 from .exceptions import UserException, OrchestraException, InternalException
 
@@ -76,7 +77,7 @@ class Executor:
         intra_component_ordering=True,
         transitive_reduction=True,
     ):
-        # Recursively collect all dependencies of the root action in an initial graph
+        # Collect all dependencies of the root actions in an initial graph
         dependency_graph = self._create_initial_dependency_graph()
 
         # Find an assignment for all the choices that ensure the resulting graph is acyclic
@@ -123,24 +124,28 @@ class Executor:
         graph.add_node(DUMMY_ROOT)
         for action in self.actions:
             graph.add_edge(DUMMY_ROOT, action)
-            self._collect_dependencies(action, graph)
+        self._collect_dependencies(self.actions, graph)
         return graph
 
-    def _collect_dependencies(self, action, graph, already_visited_nodes=None):
-        if already_visited_nodes is None:
-            already_visited_nodes = set()
-
-        if action in already_visited_nodes:
-            return
+    def _collect_dependencies(self, root_actions, graph):
+        """Adds the given actions and all their transitive dependencies to the graph.
+        The visit is iterative and shared by all the roots, so every action is expanded only once.
+        """
+        to_visit = list(root_actions)
+        already_visited_nodes = set()
+        while to_visit:
+            action = to_visit.pop()
+            if action in already_visited_nodes:
+                continue
 
-        already_visited_nodes.add(action)
-        graph.add_node(action)
-        if self.no_deps:
-            return
+            already_visited_nodes.add(action)
+            graph.add_node(action)
+            if self.no_deps:
+                continue
 
-        for dependency in action.dependencies:
-            graph.add_edge(action, dependency)
-            self._collect_dependencies(dependency, graph, already_visited_nodes=already_visited_nodes)
+            for dependency in action.dependencies:
+                graph.add_edge(action, dependency)
+                to_visit.append(dependency)
 
     def _assign_choices(self, graph):
         """AnyOf nodes have more than one successor, of which only one has to be picked for inclusion in the final
@@ -257,18 +262,28 @@ class Executor:
 
     @staticmethod
     def _remove_satisfied_attracting_components(graph):
-        # Remove sets of attracting components where all components are satisfied
-        fixed_point_reached = False
-        done_something = False
-        while not fixed_point_reached:
-            fixed_point_reached = True
-            for attracting_components in nx.attracting_components(graph):
-                if all(c.is_satisfied() for c in attracting_components):
-                    graph.remove_nodes_from(attracting_components)
-                    fixed_point_reached = False
-                    done_something = True
-                    break
-        return done_something
+        """Removes sets of attracting components where all components are satisfied.
+
+        This is equivalent to repeatedly removing a satisfied attracting component until none is left, but the strongly
+        connected components are visited only once, from the leaves up, and each action is checked only once.
+        """
+        satisfied = check_satisfied(graph.nodes)
+
+        condensed_graph = nx.algorithms.condensation(graph)
+        members = nx.get_node_attributes(condensed_graph, "members")
+
+        # A strongly connected component can be removed if all its actions are satisfied and all the components it
+        # depends on can be removed too
+        removable = set()
+        for condensed_node in reversed(list(nx.topological_sort(condensed_graph))):
+            all_satisfied = all(satisfied[a] for a in members[condensed_node])
+            dependencies_removable = all(d in removable for d in condensed_graph.successors(condensed_node))
+            if all_satisfied and dependencies_removable:
+                removable.add(condensed_node)
+
+        actions_to_remove = [a for condensed_node in removable for a in members[condensed_node]]
+        graph.remove_nodes_from(actions_to_remove)
+        return bool(actions_to_remove)
 
     def _enforce_intra_component_ordering(self, dependency_graph):
         """This pass ensures that when two builds of the same component are
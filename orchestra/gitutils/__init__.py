@@ -8,6 +8,8 @@ from loguru import logger
 from ..actions.util import get_subprocess_output, run_internal_subprocess
 from ..exceptions import InternalException, InternalCommandException
 
+_HEADS_PREFIX = "refs/heads/"
+
 
 def _only(elements):
     assert len(elements) == 1
@@ -46,9 +48,13 @@ def ls_remote(remote):
     except InternalCommandException:
         return {}
 
-    parse_regex = re.compile(r"(?P<commit>[a-f0-9]*)\W*refs/heads/(?P<branch>.*)")
-
-    return {branch: commit for commit, branch in parse_regex.findall(result)}
+    # Each line has the format "<commit>\t<ref>"
+    heads = {}
+    for line in result.splitlines():
+        commit, _, ref = line.partition("\t")
+        if ref.startswith(_HEADS_PREFIX):
+            heads[ref[len(_HEADS_PREFIX) :]] = commit
+    return heads
 
 
 def current_branch_info(repo_path):
@@ -1,7 +1,7 @@
 import os
 import json
+import threading
 import yaml
-from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Set, Union, Optional
 
@@ -24,6 +24,9 @@ class Component:
         self.add_to_path = serialized_component.get("add_to_path", [])
         self.repository = serialized_component.get("repository")
         self._recursive_hash = None
+        self._recursive_hash_material = None
+        # Builds of the same component may request the hash concurrently (e.g. when checking if they are satisfied)
+        self._recursive_hash_lock = threading.Lock()
         self._resolve_dependencies_called = False
 
         self.clone: Union[clone.CloneAction, None] = None
@@ -76,30 +79,34 @@ class Component:
     def recursive_hash(self):
         assert self._resolve_dependencies_called, "Called recursive_hash before resolve_dependencies"
 
-        if self._recursive_hash is None:
-            hash_material = self.recursive_hash_material()
-            self._recursive_hash = hash(hash_material)
+        with self._recursive_hash_lock:
+            if self._recursive_hash is None:
+                hash_material = self.recursive_hash_material()
+                self._recursive_hash = hash(hash_material)
 
         return self._recursive_hash
 
-    @lru_cache(maxsize=None, typed=False)
     def recursive_hash_material(self) -> str:
         """Returns the string that is hashed to compute recursive_hash"""
         assert self._resolve_dependencies_called, "Called recursive_hash_material before resolve_dependencies"
-        hash_material = None
 
-        if self._use_config_cache:
-            hash_material = self._get_cached_hash_material()
+        if self._recursive_hash_material is None:
+            hash_material = None
 
-        if hash_material is None:
-            components_to_hash = list(self._transitive_dependencies())
-            components_to_hash.sort(key=lambda c: c.name)
-            hash_material = [c.serialize() for c in components_to_hash]
+            if self._use_config_cache:
+                hash_material = self._get_cached_hash_material()
 
-            hash_material = yamldump(hash_material)
-            self._cache_hash_material(hash_material)
+            if hash_material is None:
+                components_to_hash = list(self._transitive_dependencies())
+                components_to_hash.sort(key=lambda c: c.name)
+                hash_material = [c.serialize() for c in components_to_hash]
 
-        return hash_material
+                hash_material = yamldump(hash_material)
+                self._cache_hash_material(hash_material)
+
+            self._recursive_hash_material = hash_material
+
+        return self._recursive_hash_material
 
     def _get_cached_hash_material(self) -> Optional[str]:
         assert self._resolve_dependencies_called, "Called _get_cached_hash_material before resolve_dependencies"
@@ -207,12 +214,14 @@ class Component:
 
 
 def collect_dependencies(root_action, collected_actions):
-    if root_action in collected_actions:
-        return
-
-    collected_actions.add(root_action)
-    for d in root_action.dependencies_for_hash:
-        collect_dependencies(d, collected_actions)
+    to_visit = [root_action]
+    while to_visit:
+        action = to_visit.pop()
+        if action in collected_actions:
+            continue
+
+        collected_actions.add(action)
+        to_visit.extend(action.dependencies_for_hash)
 
 
 def yamldump(data):
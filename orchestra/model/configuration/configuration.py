@@ -38,6 +38,9 @@ class Configuration:
 
         self.repositories: Dict[str, CloneAction] = {}
 
+        # Memoizes Action.is_satisfied, cleared whenever the state on disk is changed by orchestra
+        self.satisfied_cache: "Dict[Action, bool]" = {}
+
         # Allows to trigger a build from source if binary archives are not found
         self.fallback_to_build = fallback_to_build
 
@@ -134,8 +137,8 @@ class Configuration:
             build = component.default_build
         return build
 
-    def global_env(self) -> "OrderedDict[str, str]":
-        env = OrderedDict()
+    def global_env(self) -> "Dict[str, str]":
+        env = {}
         env["ORCHESTRA_DOTDIR"] = self.orchestra_dotdir
         env["ORCHESTRA_ROOT"] = self.orchestra_root
         env["SOURCE_ARCHIVES"] = self.source_archives
@@ -184,6 +187,14 @@ class Configuration:
         for component in self.components.values():
             component.resolve_dependencies(self)
 
+        # Third pass: no more dependencies will be added, freeze them
+        for component in self.components.values():
+            if component.clone:
+                component.clone.finalize()
+            for build in component.builds.values():
+                build.configure.finalize()
+                build.install.finalize()
+
     def _check_minimum_version(self):
         min_version = self.parsed_yaml.get("min_orchestra_version")
         if min_version:
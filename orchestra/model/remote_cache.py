@@ -45,9 +45,10 @@ class RemoteHeadsCache:
         def get_branches(repository):
             logger.debug(f"Fetching the latest remote commit for {repository}")
 
-            remotes = [f"{base_url}/{repository}" for base_url in self.config.remotes.values()]
+            # Remotes are tried in priority order, lower priority remotes are only contacted if the repository
+            # is not found on the previous ones
             result = None
-            for remote in remotes:
+            for remote in self.config.repositories[repository].remote_urls:
                 result = ls_remote(remote)
                 if result:
                     self._cached_remote_data[repository] = result
@@ -68,8 +69,17 @@ class RemoteHeadsCache:
         return failed_repositories
 
     def _persist_cache(self):
-        with open(self.cache_path, "w") as f:
-            json.dump(self._cached_remote_data, f)
+        # Write to a temporary file and atomically move it in place, so that other orchestra processes
+        # never read a partially written cache
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(self._cached_remote_data, f)
+            os.replace(tmp_path, self.cache_path)
+        except:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
 
     def set_entry(self, repository, branch_name, commit):
         """Sets a cache entry and persists the cache to disk. Not thread safe!"""
@@ -1,8 +1,7 @@
 import os
 import re
 import sys
-from collections import OrderedDict
-from typing import Mapping
+from typing import Dict, Mapping
 
 from .exceptions import UserException
 
@@ -28,7 +27,7 @@ def export_environment(variables: Mapping):
     return env
 
 
-def expand_variables(string: str, additional_environment: "OrderedDict[str, str]" = None):
+def expand_variables(string: str, additional_environment: "Dict[str, str]" = None):
     """Expands environment variables in `string` using values taken from the system environment and the additional
     dictionary if supplied. Supported syntax:
 
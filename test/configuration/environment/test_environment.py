@@ -84,7 +84,9 @@ def assert_user_can_set_action_environment(action, orchestra: OrchestraShim, mon
         overlay2 = orchestra.unset_environment_variable("ENV_VAR_B")
 
         # HACK: overriding variables at runtime requires updating the configuration referenced by the action
+        # and discarding the environment cached from the previous configuration
         m.setattr(action, "config", orchestra.configuration)
+        m.setattr(action, "_environment_cache", None)
 
         assert_script_succeeds_in_action_context(action, check_script, m)
 
@@ -2,6 +2,9 @@ import os
 import pytest
 from textwrap import dedent
 
+from orchestra.actions.uninstall import uninstall
+from orchestra.model.configuration import Configuration
+
 from ..orchestra_shim import OrchestraShim
 from ..utils.json import load_json
 from ..utils.filelist import compare_root_tree
@@ -194,3 +197,20 @@ def test_discard_build_directory(orchestra: OrchestraShim):
     """Checks that the --keep-tmproot option works"""
     orchestra("install", "-b", "--keep-tmproot", "--discard-build-directories", "component_A")
     assert not os.path.exists(orchestra.configuration.components["component_A"].default_build.install.build_dir)
+
+
+def test_satisfied_cache_invalidation(orchestra: OrchestraShim):
+    """Checks that the memoized satisfaction of an install action is recomputed after running it and after uninstalling
+    the component, while using the same configuration
+    """
+    # A single configuration is used for the whole test, allowing to build from source
+    configuration = Configuration(override_orchestra_dotdir=orchestra.orchestra_dotdir, fallback_to_build=True)
+    build = configuration.components["component_A"].default_build
+    assert not build.install.is_satisfied()
+
+    build.configure.run()
+    build.install.run()
+    assert build.install.is_satisfied()
+
+    uninstall("component_A", configuration)
+    assert not build.install.is_satisfied()
@@ -1,5 +1,8 @@
+import networkx as nx
 import pytest
 
+from orchestra.executor import Executor
+
 from ..orchestra_shim import OrchestraShim
 
 
@@ -72,3 +75,65 @@ def test_same_component_ordering(orchestra: OrchestraShim):
 
     # Install
     orchestra("install", "-b", "component_sco_A")
+
+
+class FakeAction:
+    """Minimal stand-in for an action, only providing is_satisfied"""
+
+    def __init__(self, name, satisfied):
+        self.name = name
+        self.satisfied = satisfied
+
+    def is_satisfied(self):
+        return self.satisfied
+
+    def __repr__(self):
+        return self.name
+
+
+def test_remove_satisfied_cycle():
+    """Checks that a cycle of satisfied actions is removed together with the satisfied actions it depends on, while its
+    unsatisfied dependant is kept
+    """
+    root = FakeAction("root", False)
+    cycle_a = FakeAction("cycle_a", True)
+    cycle_b = FakeAction("cycle_b", True)
+    leaf = FakeAction("leaf", True)
+
+    graph = nx.DiGraph()
+    graph.add_edges_from([(root, cycle_a), (cycle_a, cycle_b), (cycle_b, cycle_a), (cycle_b, leaf)])
+
+    assert Executor._remove_satisfied_attracting_components(graph)
+    assert set(graph.nodes) == {root}
+
+
+def test_keep_partially_satisfied_cycle():
+    """Checks that a cycle is kept if any of its actions is not satisfied"""
+    cycle_a = FakeAction("cycle_a", True)
+    cycle_b = FakeAction("cycle_b", False)
+
+    graph = nx.DiGraph()
+    graph.add_edges_from([(cycle_a, cycle_b), (cycle_b, cycle_a)])
+
+    assert not Executor._remove_satisfied_attracting_components(graph)
+    assert set(graph.nodes) == {cycle_a, cycle_b}
+
+
+def test_keep_satisfied_action_depending_on_unsatisfied():
+    """Checks that a satisfied action is kept if it depends on an unsatisfied action"""
+    satisfied = FakeAction("satisfied", True)
+    unsatisfied = FakeAction("unsatisfied", False)
+
+    graph = nx.DiGraph()
+    graph.add_edge(satisfied, unsatisfied)
+
+    assert not Executor._remove_satisfied_attracting_components(graph)
+    assert set(graph.nodes) == {satisfied, unsatisfied}
+
+
+def test_remove_satisfied_empty_graph():
+    """Checks that an empty graph is handled"""
+    graph = nx.DiGraph()
+
+    assert not Executor._remove_satisfied_attracting_components(graph)
+    assert len(graph) == 0
@@ -1,4 +1,8 @@
 from pathlib import Path
+from textwrap import dedent
+
+from orchestra.gitutils import ls_remote
+from orchestra.model import remote_cache
 
 from ..utils import git
 from ..conftest import OrchestraShim
@@ -106,6 +110,59 @@ def test_update_remote_heads(orchestra: OrchestraShim):
     assert commit_hash == remote_initial_commit_hash
 
 
+def test_update_remote_heads_priority(orchestra: OrchestraShim, test_data_mgr, monkeypatch):
+    """Checks that `orchestra update` takes the cached HEAD pointers from the highest priority remote, without
+    contacting lower priority remotes
+    """
+    # Create a high priority remote with a different commit
+    primary_remote_base_url = test_data_mgr.copy_always("remote_sources", suffix="_primary")
+    OrchestraShim._init_all_subdirs_as_git_repos(primary_remote_base_url)
+    primary_repository_path = primary_remote_base_url / "component_A"
+    Path(primary_repository_path / "somefile").write_text("primary remote content")
+    primary_commit_hash = git.commit_all(primary_repository_path)
+    orchestra.add_remote_base_url("primary", primary_remote_base_url, priority="high")
+
+    contacted_remotes = []
+
+    def recording_ls_remote(remote):
+        contacted_remotes.append(remote)
+        return ls_remote(remote)
+
+    monkeypatch.setattr(remote_cache, "ls_remote", recording_ls_remote)
+
+    orchestra("update")
+
+    assert orchestra.configuration.components["component_A"].commit() == primary_commit_hash
+    assert contacted_remotes == [f"{primary_remote_base_url}/component_A"]
+
+
+def test_update_remote_heads_fallback(orchestra: OrchestraShim, test_data_mgr, monkeypatch):
+    """Checks that `orchestra update` falls back to lower priority remotes, in order, when the repository is not found
+    on the higher priority ones
+    """
+    # Create a high priority remote which does not contain the repository
+    empty_remote_base_url = test_data_mgr.newdir("empty_remote_sources")
+    orchestra.add_remote_base_url("empty", empty_remote_base_url, priority="high")
+
+    default_commit_hash = git.rev_parse(orchestra.default_remote_base_url / "component_A")
+
+    contacted_remotes = []
+
+    def recording_ls_remote(remote):
+        contacted_remotes.append(remote)
+        return ls_remote(remote)
+
+    monkeypatch.setattr(remote_cache, "ls_remote", recording_ls_remote)
+
+    orchestra("update")
+
+    assert orchestra.configuration.components["component_A"].commit() == default_commit_hash
+    assert contacted_remotes == [
+        f"{empty_remote_base_url}/component_A",
+        f"{orchestra.default_remote_base_url}/component_A",
+    ]
+
+
 def test_update_pulls_repositories(orchestra: OrchestraShim):
     """Checks that `orchestra update` pulls repositories"""
     # Register initial repository state
@@ -135,6 +192,58 @@ def test_update_pulls_repositories(orchestra: OrchestraShim):
     assert local_repository_content_path.read_text() == modified_content
 
 
+def test_update_reports_pull_failures(orchestra: OrchestraShim, capsys):
+    """Checks that `orchestra update` pulls the repositories that can be pulled when another repository fails to pull,
+    and reports the failure
+    """
+    # Add a component whose sources will not be a git repository
+    orchestra.add_overlay(
+        dedent(
+            """
+            #@ load("@ytt:overlay", "overlay")
+
+            #@overlay/match by=overlay.all
+            ---
+            components:
+              #@overlay/match missing_ok=True
+              component_B:
+                repository: component_B
+                builds:
+                  default:
+                    configure: |
+                      mkdir -p "$BUILD_DIR"
+                    install: |
+                      true
+            """
+        ).lstrip(),
+        filename_suffix="component_B",
+    )
+
+    remote_repository_path = orchestra.default_remote_base_url / "component_A"
+    content_filename = "somefile"
+    remote_repository_content_path = Path(remote_repository_path / content_filename)
+
+    # Clone component_A, and create a source directory for component_B which is not a git repository
+    orchestra("clone", "component_A")
+    local_repository_path = orchestra.sources_dir / "component_A"
+    not_a_repository_path = orchestra.sources_dir / "component_B"
+    not_a_repository_path.mkdir()
+
+    # Modify remote repository
+    modified_content = "modified content"
+    remote_repository_content_path.write_text(modified_content)
+    remote_modified_commit_hash = git.commit_all(remote_repository_path)
+
+    capsys.readouterr()
+    orchestra("update", "--parallelism", "2")
+
+    assert git.rev_parse(local_repository_path) == remote_modified_commit_hash
+    assert (local_repository_path / content_filename).read_text() == modified_content
+
+    out, err = capsys.readouterr()
+    assert f"Directory {not_a_repository_path} is not a git repo" in out
+
+
 def test_update_does_not_overwrite_local_changes(orchestra: OrchestraShim):
     """Checks that `orchestra update` does not pulls repositories if there have been changes (only fast forwarding is
     allowed)